@@ -36,6 +36,8 @@ resource "azurerm_function_app" "pcfuncs" {
     "ANIMATION_OUTPUT_STORAGE_URL"       = var.animation_output_storage_url,
     "ANIMATION_API_ROOT_URL"             = var.funcs_data_api_url,
     "ANIMATION_TILE_REQUEST_CONCURRENCY" = tostring(var.funcs_tile_request_concurrency),
+    "ANIMATION_TILE_CACHE_MAX_BYTES"     = "33554432", # 32 MiB per worker process
+    "ANIMATION_TILE_CACHE_TTL"           = "600",
 
     # Image Function
     "IMAGE_OUTPUT_STORAGE_URL"       = var.image_output_storage_url,
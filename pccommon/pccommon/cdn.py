@@ -1,23 +1,29 @@
-import re
-
 from pccommon.config.core import PCAPIsConfig
 
-BLOB_REGEX = re.compile(r".*/([^/]+?)\.blob\.core\.windows\.net/([^/]+?).*")
+BLOB_HOST_SUFFIX = ".blob.core.windows.net/"
 
 
 class BlobCDN:
     @staticmethod
     def transform_if_available(asset_href: str) -> str:
-        m = re.match(BLOB_REGEX, asset_href)
-        if m:
-            storage_account = m.group(1)
-            container = m.group(2)
-            config = (
-                PCAPIsConfig.from_environment()
-                .get_container_config_table()
-                .get_config(storage_account, container)
-            )
-            if config and config.has_cdn:
-                asset_href = asset_href.replace("blob.core.windows", "azureedge")
+        # Plain string searches are used rather than a regex, as this runs
+        # for every asset href that is read by the tiler.
+        idx = asset_href.find(BLOB_HOST_SUFFIX)
+        if idx < 0:
+            return asset_href
+
+        storage_account = asset_href[asset_href.rfind("/", 0, idx) + 1 : idx]
+        path = asset_href[idx + len(BLOB_HOST_SUFFIX) :]
+        container = path.partition("/")[0].partition("?")[0]
+        if not storage_account or not container:
+            return asset_href
+
+        config = (
+            PCAPIsConfig.from_environment()
+            .get_container_config_table()
+            .get_config(storage_account, container)
+        )
+        if config and config.has_cdn:
+            asset_href = asset_href.replace("blob.core.windows", "azureedge", 1)
 
         return asset_href
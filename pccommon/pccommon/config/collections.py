@@ -1,8 +1,9 @@
+import sys
 from typing import Any, Dict, List, Optional
 
 import orjson
 from humps import camelize
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from pccommon.tables import ModelTableService
 from pccommon.utils import get_param_str, orjson_dumps
@@ -32,6 +33,11 @@ class DefaultRenderConfig(BaseModel):
     max_items_per_tile: Optional[int] = None
     hidden: bool = False  # Hide from API
 
+    # The assets and render parameters portion of the query string is the
+    # same for every item in a collection, so it is computed once per
+    # instance.
+    _render_qs_suffix: Optional[str] = PrivateAttr(default=None)
+
     def get_full_render_qs(self, collection: str, item: Optional[str] = None) -> str:
         """
         Return the full render query string, including the
@@ -39,10 +45,24 @@ class DefaultRenderConfig(BaseModel):
         """
         collection_part = f"collection={collection}" if collection else ""
         item_part = f"&item={item}" if item else ""
-        asset_part = self.get_assets_params()
-        render_part = self.get_render_params()
 
-        return "".join([collection_part, item_part, asset_part, render_part])
+        return f"{collection_part}{item_part}{self._get_render_qs_suffix()}"
+
+    def _get_render_qs_suffix(self) -> str:
+        if self._render_qs_suffix is None:
+            # Many collections share render settings (e.g. the DEM
+            # collections), so share one copy of identical suffixes.
+            self._render_qs_suffix = sys.intern(
+                f"{self.get_assets_params()}{self.get_render_params()}"
+            )
+        return self._render_qs_suffix
+
+    def copy(self, **kwargs: Any) -> "DefaultRenderConfig":
+        # Private attributes are carried over by copy(), which would leave
+        # the memoized suffix stale when fields are changed with `update`.
+        copied = super().copy(**kwargs)
+        copied._render_qs_suffix = None
+        return copied
 
     def get_assets_params(self) -> str:
         """
@@ -51,11 +71,7 @@ class DefaultRenderConfig(BaseModel):
             [data1] -> "&asset=data1"
             [data1, data2] -> "&asset=data1&asset=data2"
         """
-        assets = self.assets or []
-        keys = ["&assets="] * len(assets)
-        params = ["".join(item) for item in zip(keys, assets)]
-
-        return "".join(params)
+        return "".join(f"&assets={asset}" for asset in self.assets or [])
 
     def get_render_params(self) -> str:
         return f"&{get_param_str(self.render_params)}"
@@ -74,6 +90,11 @@ class DefaultRenderConfig(BaseModel):
         return self.create_links and (not self.hidden)
 
     class Config:
+        # Instances are shared through the collection config table cache and
+        # memoize values derived from their fields, so field assignment is
+        # disallowed. Nested values such as the render_params dict are not
+        # frozen and must be treated as read-only as well.
+        allow_mutation = False
         json_loads = orjson.loads
         json_dumps = orjson_dumps
 
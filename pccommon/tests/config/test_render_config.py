@@ -1,5 +1,7 @@
 from urllib.parse import quote_plus
 
+import pytest
+
 from pccommon.config import get_render_config
 from pccommon.config.collections import DefaultRenderConfig
 
@@ -92,3 +94,44 @@ def test_listlike_rescale() -> None:
         "collection=test&expression=HH%2CHV%2CHH%2FHV&"
         "rescale=0%2C9000&rescale=0%2C1000&rescale=0%2C1"
     )
+
+
+def test_render_qs_suffix_not_serialized() -> None:
+    config = DefaultRenderConfig(
+        assets=["data1"],
+        render_params={"colormap_name": "terrain"},
+        minzoom=8,
+    )
+    first = config.get_full_render_qs("test", "item1")
+    second = config.get_full_render_qs("test", "item2")
+    assert first == "collection=test&item=item1&assets=data1&colormap_name=terrain"
+    assert second == "collection=test&item=item2&assets=data1&colormap_name=terrain"
+    assert "_render_qs_suffix" not in config.json()
+    assert DefaultRenderConfig.parse_raw(config.json()) == config
+
+
+def test_render_config_is_immutable() -> None:
+    with pytest.raises(TypeError):
+        single_asset.assets = ["data2"]  # type: ignore
+    assert single_asset.get_full_render_qs("test") == (
+        "collection=test&assets=data1&colormap_name=terrain&rescale=-1000%2C4000"
+    )
+
+
+def test_render_qs_suffix_reset_on_copy() -> None:
+    config = DefaultRenderConfig(
+        assets=["a"],
+        render_params={"colormap_name": "terrain"},
+        minzoom=8,
+    )
+    assert (
+        config.get_full_render_qs("c") == "collection=c&assets=a&colormap_name=terrain"
+    )
+
+    copied = config.copy(update={"assets": ["b"]})
+    assert (
+        copied.get_full_render_qs("c") == "collection=c&assets=b&colormap_name=terrain"
+    )
+    assert (
+        config.get_full_render_qs("c") == "collection=c&assets=a&colormap_name=terrain"
+    )
@@ -0,0 +1,76 @@
+from typing import Generator, List, Optional, Tuple
+from unittest import mock
+
+import pytest
+
+from pccommon.cdn import BlobCDN
+from pccommon.config.containers import ContainerConfig
+
+CDN_CONTAINERS = {("naipeuwest", "naip")}
+
+
+class _ContainerTable:
+    def __init__(self) -> None:
+        self.lookups: List[Tuple[str, str]] = []
+
+    def get_config(
+        self, storage_account: str, container: str
+    ) -> Optional[ContainerConfig]:
+        self.lookups.append((storage_account, container))
+        return ContainerConfig(has_cdn=(storage_account, container) in CDN_CONTAINERS)
+
+
+@pytest.fixture
+def table() -> Generator[_ContainerTable, None, None]:
+    table = _ContainerTable()
+    with mock.patch("pccommon.cdn.PCAPIsConfig.from_environment") as from_env:
+        from_env.return_value.get_container_config_table.return_value = table
+        yield table
+
+
+def test_cdn_container(table: _ContainerTable) -> None:
+    href = "https://naipeuwest.blob.core.windows.net/naip/v002/al/image.tif"
+    assert BlobCDN.transform_if_available(href) == (
+        "https://naipeuwest.azureedge.net/naip/v002/al/image.tif"
+    )
+    assert table.lookups == [("naipeuwest", "naip")]
+
+
+def test_non_cdn_container(table: _ContainerTable) -> None:
+    href = "https://sentinel2l2a01.blob.core.windows.net/sentinel2-l2/image.tif"
+    assert BlobCDN.transform_if_available(href) == href
+    assert table.lookups == [("sentinel2l2a01", "sentinel2-l2")]
+
+
+def test_sas_query_after_container(table: _ContainerTable) -> None:
+    href = "https://naipeuwest.blob.core.windows.net/naip?sv=2021-06-08&sig=abc"
+    assert BlobCDN.transform_if_available(href) == (
+        "https://naipeuwest.azureedge.net/naip?sv=2021-06-08&sig=abc"
+    )
+    assert table.lookups == [("naipeuwest", "naip")]
+
+
+def test_host_without_path(table: _ContainerTable) -> None:
+    for href in [
+        "https://naipeuwest.blob.core.windows.net",
+        "https://naipeuwest.blob.core.windows.net/",
+    ]:
+        assert BlobCDN.transform_if_available(href) == href
+    assert table.lookups == []
+
+
+def test_non_blob_host(table: _ContainerTable) -> None:
+    href = "https://example.com/naip/image.tif"
+    assert BlobCDN.transform_if_available(href) == href
+    assert table.lookups == []
+
+
+def test_replaces_first_occurrence_only(table: _ContainerTable) -> None:
+    href = (
+        "https://naipeuwest.blob.core.windows.net/naip/"
+        "copy-of-naipeuwest.blob.core.windows.net.tif"
+    )
+    assert BlobCDN.transform_if_available(href) == (
+        "https://naipeuwest.azureedge.net/naip/"
+        "copy-of-naipeuwest.blob.core.windows.net.tif"
+    )
@@ -3,9 +3,11 @@ import io
 import logging
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, List, Type
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type
 
 import aiohttp
+from cachetools import Cache, TTLCache
 from dateutil.relativedelta import relativedelta
 from funclib.errors import BBoxTooLargeError
 from funclib.stamps.stamp import FrameStamp
@@ -18,6 +20,42 @@ from .frame import AnimationFrame
 from .settings import AnimationSettings
 
 
+@lru_cache(maxsize=1)
+def get_tile_cache() -> Cache:
+    """Process-wide cache of downloaded tile bytes, keyed by tile URL.
+
+    Tile URLs include the registered search, which is derived from the
+    frame's CQL and timestamp, as well as the tile coordinates and render
+    parameters, so identical frames requested by different animations
+    share cached tiles.
+    """
+    settings = AnimationSettings.get()
+    return TTLCache(
+        maxsize=settings.tile_cache_max_bytes,
+        ttl=settings.tile_cache_ttl,
+        getsizeof=len,
+    )
+
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Client session shared by all animation requests in this process.
+
+    Reusing the session keeps pooled connections to the tiler open
+    between requests. A session is bound to the event loop it was created
+    on, so a new one is created if the running loop has changed.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession()
+        _session_loop = loop
+    return _session
+
+
 class PcMosaicAnimation:
     def __init__(
         self,
@@ -40,6 +78,7 @@ class PcMosaicAnimation:
         settings = AnimationSettings.get()
         self.registerUrl = f"{settings.api_root_url}/mosaic/register/"
         self.async_limit = asyncio.Semaphore(settings.tile_request_concurrency)
+        self.tile_cache = get_tile_cache()
         self.stamps = stamps
 
         if len(self.tiles) > MAX_TILE_COUNT:
@@ -48,7 +87,7 @@ class PcMosaicAnimation:
                 f" ({len(self.tiles)} of {MAX_TILE_COUNT} max tiles requested)"
             )
 
-    async def _get_tilejson(self, the_date: str) -> str:
+    async def _get_tilejson(self, session: aiohttp.ClientSession, the_date: str) -> str:
         non_temporal_args = [
             arg
             for arg in self.cql["filter"]["args"]
@@ -64,57 +103,59 @@ class PcMosaicAnimation:
         frame_cql["filter"]["args"] = non_temporal_args
         logging.info(f"Registering {the_date}")
 
-        async with aiohttp.ClientSession() as session:
-            # Register the search and get the tilejson_url back
-            async with session.post(self.registerUrl, json=frame_cql) as resp:
-                mosaic_info = await resp.json()
-            tilejson_href = [
-                link["href"]
-                for link in mosaic_info["links"]
-                if link["rel"] == "tilejson"
-            ][0]
-            tilejson_url = f"{tilejson_href}?{self.render_params}"
-
-            # Get the full tile path template
-            async with session.get(tilejson_url) as resp:
-                tilejson = await resp.json()
-            return tilejson["tiles"][0]
-
-    async def _get_tile(self, url: str) -> io.BytesIO:
-        async with aiohttp.ClientSession() as session:
-            async with self.async_limit:
-                # Download the image tile, block if exceeding concurrency limits
-                async with await session.get(url) as resp:
-                    if self.async_limit.locked():
-                        logging.info("Concurrency limit reached, waiting...")
-                        await asyncio.sleep(1)
-
-                    if resp.status == 200:
-                        return io.BytesIO(await resp.read())
-                    else:
-                        logging.warning(f"Tile request: {resp.status} {url}")
-                        img_bytes = Image.new(
-                            "RGB", (self.tile_size, self.tile_size), "gray"
-                        )
-                        empty = io.BytesIO()
-                        img_bytes.save(empty, format="png")
-                        return empty
+        # Register the search and get the tilejson_url back
+        async with session.post(self.registerUrl, json=frame_cql) as resp:
+            mosaic_info = await resp.json()
+        tilejson_href = [
+            link["href"] for link in mosaic_info["links"] if link["rel"] == "tilejson"
+        ][0]
+        tilejson_url = f"{tilejson_href}?{self.render_params}"
+
+        # Get the full tile path template
+        async with session.get(tilejson_url) as resp:
+            tilejson = await resp.json()
+        return tilejson["tiles"][0]
+
+    async def _get_tile(self, session: aiohttp.ClientSession, url: str) -> io.BytesIO:
+        cached: Optional[bytes] = self.tile_cache.get(url)
+        if cached is not None:
+            return io.BytesIO(cached)
+
+        # Download the image tile, block if exceeding concurrency limits
+        async with self.async_limit:
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    content = await resp.read()
+                    # A max size of 0 disables tile caching
+                    if len(content) <= self.tile_cache.maxsize:
+                        self.tile_cache[url] = content
+                    return io.BytesIO(content)
+                else:
+                    logging.warning(f"Tile request: {resp.status} {url}")
+                    img_bytes = Image.new(
+                        "RGB", (self.tile_size, self.tile_size), "gray"
+                    )
+                    empty = io.BytesIO()
+                    img_bytes.save(empty, format="png")
+                    return empty
 
     async def get(
         self, delta: relativedelta, start: datetime, frame_count: int
     ) -> io.BytesIO:
         frames: List[asyncio.Future[PILImage]] = []
 
+        session = get_session()
         next_date = start
         for frame_number in range(frame_count):
             frames.append(
                 asyncio.ensure_future(
-                    self._get_frame(next_date, frame_count, frame_number)
+                    self._get_frame(session, next_date, frame_count, frame_number)
                 )
             )
             next_date += delta
 
         image_frames: List[PILImage] = list(await asyncio.gather(*frames))
+
         gif = image_frames[0]
         output = io.BytesIO()
         gif.save(
@@ -130,9 +171,13 @@ class PcMosaicAnimation:
         return output
 
     async def _get_frame(
-        self, date: datetime, frame_count: int, frame_number: int
+        self,
+        session: aiohttp.ClientSession,
+        date: datetime,
+        frame_count: int,
+        frame_number: int,
     ) -> PILImage:
-        tile_path = await self._get_tilejson(date.isoformat())
+        tile_path = await self._get_tilejson(session, date.isoformat())
 
         tasks: List[asyncio.Future[io.BytesIO]] = []
         for tile in self.tiles:
@@ -141,7 +186,7 @@ class PcMosaicAnimation:
                 .replace("{y}", str(tile.y))
                 .replace("{z}", str(tile.z))
             )
-            tasks.append(asyncio.ensure_future(self._get_tile(url)))
+            tasks.append(asyncio.ensure_future(self._get_tile(session, url)))
 
         tile_images: List[io.BytesIO] = list(await asyncio.gather(*tasks))
         bbox = Bbox(
@@ -5,3 +5,6 @@ MAX_TILE_COUNT = 16
 
 MAX_FRAMES = 24
 DEFAULT_CONCURRENCY = 10
+
+DEFAULT_TILE_CACHE_TTL = 600  # 10 minutes
+DEFAULT_TILE_CACHE_MAX_BYTES = 32 * 1024 * 1024
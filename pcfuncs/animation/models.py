@@ -1,6 +1,8 @@
 from datetime import datetime
-from typing import Any, Callable, Dict, List
-from urllib.parse import quote
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
+from urllib.parse import parse_qs, quote, urlencode
 
 from dateutil.relativedelta import relativedelta
 from pydantic import BaseModel, Field, validator
@@ -8,23 +10,34 @@ from pydantic import BaseModel, Field, validator
 from .constants import MAX_FRAMES
 
 
-def _get_render_options(render_params: str) -> Dict[str, List[str]]:
-    result: Dict[str, List[str]] = {}
-    for p in render_params.split("&"):
-        k, v = p.split("=")
-        if k not in result:
-            result[k] = []
-        result[k].append(v)
-    return result
-
-
-_deltas: Dict[str, Callable[[int], relativedelta]] = {
-    "mins": lambda step: relativedelta(minutes=step),
-    "hours": lambda step: relativedelta(hours=step),
-    "days": lambda step: relativedelta(days=step),
-    "weeks": lambda step: relativedelta(weeks=step),
-    "months": lambda step: relativedelta(months=step),
-    "years": lambda step: relativedelta(years=step),
+@lru_cache(maxsize=128)
+def _get_render_options(render_params: str) -> Mapping[str, List[str]]:
+    """Parse a render_params query string.
+
+    Results are cached so that validation and the accessors on
+    AnimationRequest share a single parse. The result should be treated
+    as read-only.
+    """
+    # Literal "+" characters are significant in band math expressions, so
+    # escape them rather than letting parse_qs decode them as spaces.
+    # Strict parsing raises on fields without an "=" or empty fields.
+    return MappingProxyType(
+        parse_qs(
+            render_params.replace("+", "%2B"),
+            keep_blank_values=True,
+            strict_parsing=True,
+        )
+    )
+
+
+# Maps animation units to the relativedelta keyword for that unit
+_deltas: Dict[str, str] = {
+    "mins": "minutes",
+    "hours": "hours",
+    "days": "days",
+    "weeks": "weeks",
+    "months": "months",
+    "years": "years",
 }
 
 
@@ -51,6 +64,8 @@ class AnimationRequest(BaseModel):
             raise ValueError("Missing collection in render_params")
         if len(render_options["collection"]) != 1:
             raise ValueError("Multiple collections in render_params")
+        if not render_options["collection"][0]:
+            raise ValueError("Missing collection in render_params")
         return v
 
     @validator("unit")
@@ -61,24 +76,25 @@ class AnimationRequest(BaseModel):
             )
         return v
 
+    @property
+    def render_options(self) -> Mapping[str, List[str]]:
+        """The parsed render_params, shared with validation."""
+        return _get_render_options(self.render_params)
+
     def get_collection(self) -> str:
-        render_options = _get_render_options(self.render_params)
-        return render_options["collection"][0]
+        return self.render_options["collection"][0]
 
     def get_encoded_render_params(self) -> str:
-        encoded_options = [
-            f"{key}={quote(v)}"
-            for key, value in _get_render_options(self.render_params).items()
-            for v in value
-        ]
-        encoded_options.append("tile_scale=2")
-        return "&".join(encoded_options)
+        return urlencode(
+            {**self.render_options, "tile_scale": ["2"]}, doseq=True, quote_via=quote
+        )
 
     def get_valid_frames(self) -> int:
         return min(self.frames, MAX_FRAMES)
 
     def get_relative_delta(self) -> relativedelta:
-        return _deltas[self.unit](self.step)
+        kwargs: Dict[str, Any] = {_deltas[self.unit]: self.step}
+        return relativedelta(**kwargs)
 
 
 class AnimationResponse(BaseModel):
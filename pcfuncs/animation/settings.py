@@ -11,6 +11,8 @@ from .constants import (
     ANIMATION_SETTINGS_PREFIX,
     DEFAULT_ANIMATION_CONTAINER_URL,
     DEFAULT_CONCURRENCY,
+    DEFAULT_TILE_CACHE_MAX_BYTES,
+    DEFAULT_TILE_CACHE_TTL,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,17 @@ class AnimationSettings(BaseSettings):
     output_account_key: Optional[str] = None
     tile_request_concurrency: int = DEFAULT_CONCURRENCY
 
+    # Downloaded tiles are cached in memory so frames shared between
+    # animation requests are not requested from the tiler again.
+    #
+    # The size limit only counts tile payload bytes, not per-entry key and
+    # bookkeeping overhead, and each worker process holds its own cache.
+    # The function app runs on the Consumption plan (~1.5 GB per instance),
+    # shared with GIF assembly and the image function, so the default is
+    # kept to tens of MB (roughly 100-300 PNG tiles at 512px).
+    tile_cache_ttl: int = DEFAULT_TILE_CACHE_TTL
+    tile_cache_max_bytes: int = DEFAULT_TILE_CACHE_MAX_BYTES
+
     def get_container_client(self) -> ContainerClient:
         return get_container_client(
             self.output_storage_url,
@@ -0,0 +1,25 @@
+from typing import Any
+
+from funclib.stamps.progress_bar import BAR_HEIGHT, ProgressBarStamp
+from PIL import Image
+
+
+class _Frame:
+    def __init__(self, frame_number: int, frame_count: int) -> None:
+        self.frame_number = frame_number
+        self.frame_count = frame_count
+
+
+def test_progress_bar() -> None:
+    frame: Any = _Frame(frame_number=1, frame_count=3)
+    image = Image.new("RGBA", (100, 50), (10, 20, 30, 255))
+
+    stamped = ProgressBarStamp(frame).apply(image)
+
+    assert stamped.size == (100, 50)
+    assert stamped.getpixel((0, 50 - BAR_HEIGHT)) == (0, 120, 212, 255)
+    assert stamped.getpixel((50, 49)) == (0, 120, 212, 255)
+    assert stamped.getpixel((51, 49)) == (10, 20, 30, 255)
+    # The white background is drawn one pixel above the bar
+    assert stamped.getpixel((0, 50 - BAR_HEIGHT - 1)) == (255, 255, 255, 255)
+    assert stamped.getpixel((0, 50 - BAR_HEIGHT - 2)) == (10, 20, 30, 255)
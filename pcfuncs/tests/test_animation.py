@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import Any, Dict
+
+import aiohttp
+import pytest
+from animation.animation import PcMosaicAnimation, get_session, get_tile_cache
+from animation.models import AnimationRequest
+from dateutil.relativedelta import relativedelta
+from pydantic import ValidationError
+
+
+def _request(**kwargs: Any) -> AnimationRequest:
+    params: Dict[str, Any] = {
+        "bbox": [-96.0, 30.0, -95.0, 31.0],
+        "zoom": 10,
+        "cql": {"filter-lang": "cql2-json", "filter": {"op": "and", "args": []}},
+        "render_params": "collection=sentinel-2-l2a&assets=B04&assets=B03",
+        "start": datetime(2022, 1, 1),
+        "duration": 250,
+        "step": 1,
+        "unit": "months",
+        "frames": 5,
+    }
+    params.update(kwargs)
+    return AnimationRequest(**params)
+
+
+def test_get_collection() -> None:
+    assert _request().get_collection() == "sentinel-2-l2a"
+
+
+def test_encoded_render_params() -> None:
+    req = _request(render_params="collection=naip&assets=image&asset_bidx=image|1,2,3")
+    assert req.get_encoded_render_params() == (
+        "collection=naip&assets=image&asset_bidx=image%7C1%2C2%2C3&tile_scale=2"
+    )
+
+
+def test_render_params_requires_single_collection() -> None:
+    with pytest.raises(ValidationError):
+        _request(render_params="assets=B04")
+    with pytest.raises(ValidationError):
+        _request(render_params="collection=a&collection=b")
+
+
+def test_render_params_rejects_malformed_fields() -> None:
+    for render_params in [
+        "",
+        "collection",
+        "collection=",
+        "collection=naip&assets",
+        "collection=naip&&assets=image",
+    ]:
+        with pytest.raises(ValidationError):
+            _request(render_params=render_params)
+
+
+def test_encoded_render_params_expression() -> None:
+    req = _request(
+        render_params="collection=landsat&expression=(B5-B4)/(B5+B4)&rescale=-1,1"
+    )
+    assert req.get_encoded_render_params() == (
+        "collection=landsat&expression=%28B5-B4%29%2F%28B5%2BB4%29"
+        "&rescale=-1%2C1&tile_scale=2"
+    )
+
+
+def test_relative_delta() -> None:
+    req = _request(step=2, unit="mins")
+    assert req.get_relative_delta() == relativedelta(minutes=2)
+
+    with pytest.raises(ValidationError):
+        _request(unit="fortnights")
+
+
+async def test_get_tile_uses_cache() -> None:
+    animation = PcMosaicAnimation(
+        bbox=[-96.0, 30.0, -95.9, 30.1],
+        zoom=10,
+        cql={},
+        render_params="collection=naip",
+        stamps=[],
+    )
+    url = "http://tiler.test/mosaic/tiles/abc/10/1/2@1x?collection=naip"
+    get_tile_cache()[url] = b"tile"
+
+    async with aiohttp.ClientSession() as session:
+        tile = await animation._get_tile(session, url)
+
+    assert tile.read() == b"tile"
+
+
+async def test_get_session_is_reused() -> None:
+    session = get_session()
+    assert get_session() is session
+
+    await session.close()
+    assert get_session() is not session
+    await get_session().close()
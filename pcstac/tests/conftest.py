@@ -1,10 +1,10 @@
 import asyncio
-import json
 import os
 import time
 from typing import AsyncGenerator, Callable, Dict
 
 import asyncpg
+import orjson
 import pytest
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
@@ -54,7 +54,6 @@ async def pqe_pg():
     print(f"PGStac Migrated to {version}")
 
     yield settings.reader_connection_string
-    await conn.close()
 
 
 @pytest.fixture(scope="session")
@@ -110,7 +109,7 @@ async def app_client(app) -> AsyncGenerator[AsyncClient, None]:
 @pytest.fixture
 def load_test_data() -> Callable[[str], Dict]:
     def load_file(filename: str) -> Dict:
-        with open(os.path.join(DATA_DIR, filename)) as file:
-            return json.load(file)
+        with open(os.path.join(DATA_DIR, filename), "rb") as file:
+            return orjson.loads(file.read())
 
     return load_file
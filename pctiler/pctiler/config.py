@@ -4,7 +4,7 @@ from functools import lru_cache
 from urllib.parse import urljoin
 
 from fastapi import Request
-from pydantic import BaseSettings, Field
+from pydantic import BaseSettings, Field, validator
 
 # Hostname to fetch STAC information from
 STAC_API_URL_ENV_VAR = "STAC_API_URL"
@@ -45,6 +45,11 @@ class Settings(BaseSettings):
 
     feature_flags: FeatureFlags = FeatureFlags()
 
+    @validator("stac_api_href", always=True)
+    def _ensure_trailing_slash(cls, v: str) -> str:
+        # Allows paths to be appended to the HREF without urljoin
+        return v.rstrip("/") + "/"
+
     def get_stac_api_href(self, request: Request) -> str:
         """Generates the STAC API HREF.
 
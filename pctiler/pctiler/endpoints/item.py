@@ -1,7 +1,7 @@
-from urllib.parse import urljoin
+from functools import lru_cache
 
 from fastapi import Query, Request, Response
-from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from starlette.responses import HTMLResponse
 from titiler.core.factory import MultiBaseTilerFactory
 from titiler.pgstac.dependencies import ItemPathParams
@@ -17,21 +17,57 @@ except ImportError:
     # Try backported to PY<39 `importlib_resources`.
     from importlib_resources import files as resources_files  # type: ignore
 
+settings = get_settings()
 
 # TODO: mypy fails in python 3.9, we need to find a proper way to do this
-templates = Jinja2Templates(
-    directory=str(resources_files(__package__) / "templates")  # type: ignore
+_TEMPLATES_DIR = str(resources_files(__package__) / "templates")  # type: ignore
+
+# Templates don't change while the server is running, so skip checking
+# them for changes and keep compiled bytecode across worker processes.
+templates = Environment(
+    loader=FileSystemLoader(_TEMPLATES_DIR),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
 )
 
 
+@lru_cache(maxsize=2048)
+def _render_map_html(
+    tilejson_url: str, collection: str, item: str, item_url: str
+) -> bytes:
+    """Render the item preview page.
+
+    The template only depends on these values and not on the request, so
+    rendered pages are cached by them.
+    """
+    return (
+        templates.get_template("item_preview.html")
+        .render(
+            tileJson=tilejson_url,
+            collectionId=collection,
+            itemId=item,
+            itemUrl=item_url,
+        )
+        .encode("utf-8")
+    )
+
+
 pc_tile_factory = MultiBaseTilerFactory(
     reader=ItemSTACReader,
     path_dependency=ItemPathParams,
     colormap_dependency=PCColorMapParams,
     reader_dependency=ReaderParams,
-    router_prefix=get_settings().item_endpoint_prefix,
+    router_prefix=settings.item_endpoint_prefix,
 )
 
+# The tilejson route is static, so resolve its path relative to the app's
+# base URL once rather than looking it up in the router on every request.
+_TILEJSON_PATH = (
+    settings.item_endpoint_prefix.rstrip("/")
+    + pc_tile_factory.router.url_path_for("tilejson")
+).lstrip("/")
+
 
 @pc_tile_factory.router.get("/map", response_class=HTMLResponse)
 def map(
@@ -47,21 +83,11 @@ def map(
         )
 
     qs = render_config.get_full_render_qs(collection, item)
-    tilejson_url = pc_tile_factory.url_for(request, "tilejson")
-    tilejson_url += f"?{qs}"
+    tilejson_url = f"{request.base_url}{_TILEJSON_PATH}?{qs}"
 
-    item_url = urljoin(
-        get_settings().get_stac_api_href(request),
-        f"collections/{collection}/items/{item}",
-    )
+    stac_api_href = settings.get_stac_api_href(request)
+    item_url = f"{stac_api_href}collections/{collection}/items/{item}"
 
-    return templates.TemplateResponse(
-        "item_preview.html",
-        context={
-            "request": request,
-            "tileJson": tilejson_url,
-            "collectionId": collection,
-            "itemId": item,
-            "itemUrl": item_url,
-        },
+    return HTMLResponse(
+        content=_render_map_html(tilejson_url, collection, item, item_url)
     )
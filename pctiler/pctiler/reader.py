@@ -30,6 +30,21 @@ logger = logging.getLogger(__name__)
 cache_config = CacheSettings()
 
 
+def _get_asset_href(href: str, collection_id: Optional[str]) -> str:
+    """Sign the asset href if the collection requires it, then rewrite it
+    to the storage container's CDN if one is available.
+
+    Signing must happen first: planetary_computer only signs hrefs on
+    blob storage hosts and returns CDN hrefs unchanged.
+    """
+    if collection_id:
+        render_config = get_render_config(collection_id)
+        if render_config and render_config.requires_token:
+            href = pc.sign(href)
+
+    return BlobCDN.transform_if_available(href)
+
+
 @dataclass(init=False)
 class ReaderParams(DefaultDependency):
     """reader parameters."""
@@ -52,14 +67,7 @@ class ItemSTACReader(PgSTACReader):
     request: Optional[Request] = attr.ib(default=None)
 
     def _get_asset_url(self, asset: str) -> str:
-        asset_url = BlobCDN.transform_if_available(super()._get_asset_url(asset))
-
-        if self.input.collection_id:
-            render_config = get_render_config(self.input.collection_id)
-            if render_config and render_config.requires_token:
-                asset_url = pc.sign(asset_url)
-
-        return asset_url
+        return _get_asset_href(super()._get_asset_url(asset), self.input.collection_id)
 
 
 @attr.s
@@ -85,15 +93,9 @@ class MosaicSTACReader(pgstac_mosaic.CustomSTACReader):
         if asset not in self.assets:
             raise InvalidAssetName(f"{asset} is not valid")
 
-        asset_url = BlobCDN.transform_if_available(self.input["assets"][asset]["href"])
-
-        collection = self.input.get("collection", None)
-        if collection:
-            render_config = get_render_config(collection)
-            if render_config and render_config.requires_token:
-                asset_url = pc.sign(asset_url)
-
-        return asset_url
+        return _get_asset_href(
+            self.input["assets"][asset]["href"], self.input.get("collection", None)
+        )
 
 
 @attr.s
@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from pctiler.endpoints.item import _render_map_html
+
 
 @pytest.mark.asyncio
 async def test_item(client: AsyncClient) -> None:
@@ -14,3 +16,25 @@ async def test_item(client: AsyncClient) -> None:
     )
     assert response.status_code == 200
     assert response.json() == ["image"]
+
+
+@pytest.mark.asyncio
+async def test_item_map(client: AsyncClient) -> None:
+    url = "/item/map?collection=naip&item=al_m_3008501_ne_16_060_20191109_20200114"
+    _render_map_html.cache_clear()
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert (
+        "http://test/item/tilejson.json"
+        "?collection=naip&item=al_m_3008501_ne_16_060_20191109_20200114"
+    ) in response.text
+    assert (
+        "http://localhost:8080/stac/"
+        "collections/naip/items/al_m_3008501_ne_16_060_20191109_20200114"
+    ) in response.text
+
+    # Subsequent requests are served from the rendered page cache
+    cached_response = await client.get(url)
+    assert cached_response.text == response.text
+    assert _render_map_html.cache_info().hits == 1
@@ -0,0 +1,56 @@
+from typing import Any, Optional
+from unittest import mock
+
+from pccommon.config.collections import DefaultRenderConfig
+from pccommon.config.containers import ContainerConfig
+from pctiler.reader import _get_asset_href
+
+BLOB_HREF = "https://naipeuwest.blob.core.windows.net/naip/v002/al/image.tif"
+
+
+def _sign(href: str) -> str:
+    # Like planetary_computer, only sign hrefs on blob storage hosts
+    if ".blob.core.windows.net/" in href:
+        return f"{href}?sv=2021-06-08&sig=abc"
+    return href
+
+
+def _get_asset_href_with(
+    href: str, collection_id: Optional[str], requires_token: bool, has_cdn: bool
+) -> str:
+    render_config = DefaultRenderConfig(
+        render_params={}, minzoom=8, requires_token=requires_token
+    )
+    container_table: Any = mock.Mock()
+    container_table.get_config.return_value = ContainerConfig(has_cdn=has_cdn)
+
+    with mock.patch(
+        "pctiler.reader.get_render_config", return_value=render_config
+    ), mock.patch("pctiler.reader.pc.sign", side_effect=_sign), mock.patch(
+        "pccommon.cdn.PCAPIsConfig.from_environment"
+    ) as from_env:
+        from_env.return_value.get_container_config_table.return_value = container_table
+        return _get_asset_href(href, collection_id)
+
+
+def test_signed_asset_in_cdn_container() -> None:
+    href = _get_asset_href_with(BLOB_HREF, "naip", requires_token=True, has_cdn=True)
+    assert href == (
+        "https://naipeuwest.azureedge.net/naip/v002/al/image.tif"
+        "?sv=2021-06-08&sig=abc"
+    )
+
+
+def test_signed_asset_without_cdn() -> None:
+    href = _get_asset_href_with(BLOB_HREF, "naip", requires_token=True, has_cdn=False)
+    assert href == f"{BLOB_HREF}?sv=2021-06-08&sig=abc"
+
+
+def test_unsigned_asset_in_cdn_container() -> None:
+    href = _get_asset_href_with(BLOB_HREF, "naip", requires_token=False, has_cdn=True)
+    assert href == "https://naipeuwest.azureedge.net/naip/v002/al/image.tif"
+
+
+def test_asset_without_collection_is_not_signed() -> None:
+    href = _get_asset_href_with(BLOB_HREF, None, requires_token=True, has_cdn=False)
+    assert href == BLOB_HREF